@@ -0,0 +1,181 @@
+"""Cold-start benchmark for the MCP server in HTTP mode.
+
+Starts `server.py` as a fresh process and measures:
+- time-to-first-listen: process spawn until the port accepts TCP connections
+- time-to-first-tool-response: process spawn until a `fetch_context` call returns
+
+Each metric is the median over several runs and is checked against a budget;
+the script exits non-zero if a budget is exceeded. It runs in CI via
+`.github/workflows/startup-benchmark.yml`.
+
+By default the system prompt is pre-rendered first and passed through
+`SYSTEM_PROMPT_RENDERED_PATH`, as in the Docker image; `--prompt template`
+measures the render-on-first-use path instead.
+
+    uv run python benchmarks/startup_benchmark.py --runs 5
+"""
+
+import argparse
+import json
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import urllib.request
+from pathlib import Path
+from typing import Optional
+
+SERVER_PATH = Path(__file__).resolve().parents[1] / "server.py"
+
+# Budgets in seconds for the in-process part of a cold start (excludes machine boot).
+DEFAULT_LISTEN_BUDGET = 3.0
+DEFAULT_TOOL_BUDGET = 4.0
+
+
+def _free_port() -> int:
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def _wait_for_listen(port: int, proc: subprocess.Popen, timeout: float) -> None:
+    deadline = time.perf_counter() + timeout
+    while time.perf_counter() < deadline:
+        if proc.poll() is not None:
+            raise RuntimeError(f"Server exited early with code {proc.returncode}")
+        try:
+            with socket.create_connection(("127.0.0.1", port), timeout=0.1):
+                return
+        except OSError:
+            time.sleep(0.01)
+    raise TimeoutError(f"Server did not listen on port {port} within {timeout}s")
+
+
+def _post(url: str, body: dict, session_id: Optional[str] = None) -> tuple:
+    headers = {
+        "Content-Type": "application/json",
+        "Accept": "application/json, text/event-stream",
+    }
+    if session_id:
+        headers["mcp-session-id"] = session_id
+    req = urllib.request.Request(url, data=json.dumps(body).encode(), headers=headers, method="POST")
+    with urllib.request.urlopen(req, timeout=30) as resp:
+        return resp.headers.get("mcp-session-id"), resp.read().decode()
+
+
+def _call_fetch_context(port: int) -> None:
+    url = f"http://127.0.0.1:{port}/mcp"
+    session_id, _ = _post(url, {
+        "jsonrpc": "2.0",
+        "method": "initialize",
+        "params": {
+            "protocolVersion": "2024-11-05",
+            "capabilities": {},
+            "clientInfo": {"name": "startup-benchmark", "version": "0.1.0"},
+        },
+        "id": 1,
+    })
+    if not session_id:
+        raise RuntimeError("No mcp-session-id header in initialization response")
+    _post(url, {"jsonrpc": "2.0", "method": "notifications/initialized", "params": {}}, session_id)
+    _, text = _post(url, {
+        "jsonrpc": "2.0",
+        "method": "tools/call",
+        "params": {"name": "fetch_context", "arguments": {}},
+        "id": 2,
+    }, session_id)
+    for line in text.splitlines():
+        if line.startswith("data: "):
+            data = json.loads(line[6:])
+            if "error" in data or data.get("result", {}).get("isError"):
+                raise RuntimeError(f"fetch_context failed: {data}")
+            return
+    raise RuntimeError("No result returned from fetch_context")
+
+
+def render_prompt_artifact(path: Path) -> None:
+    """Pre-render the system prompt exactly as the Docker build does."""
+    subprocess.run(
+        [sys.executable, str(SERVER_PATH), "--render-system-prompt", str(path)],
+        check=True,
+    )
+
+
+def measure_once(timeout: float, rendered_prompt: Optional[Path] = None) -> tuple:
+    """Start a fresh server process and return (time_to_listen, time_to_tool_response)."""
+    port = _free_port()
+    env = dict(os.environ)
+    env.pop("SYSTEM_PROMPT_RENDERED_PATH", None)
+    if rendered_prompt is not None:
+        env["SYSTEM_PROMPT_RENDERED_PATH"] = str(rendered_prompt)
+    env.update({
+        "MCP_TRANSPORT": "http",
+        "PORT": str(port),
+        # Unroutable so the background API wake-up never touches the network.
+        "MECHAFIL_SERVER_URL": env.get("BENCH_MECHAFIL_SERVER_URL", "http://127.0.0.1:9"),
+    })
+    start = time.perf_counter()
+    proc = subprocess.Popen(
+        [sys.executable, str(SERVER_PATH)],
+        env=env,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    try:
+        _wait_for_listen(port, proc, timeout)
+        listen = time.perf_counter() - start
+        _call_fetch_context(port)
+        tool = time.perf_counter() - start
+    finally:
+        proc.terminate()
+        try:
+            proc.wait(timeout=5)
+        except subprocess.TimeoutExpired:
+            proc.kill()
+    return listen, tool
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--listen-budget", type=float, default=DEFAULT_LISTEN_BUDGET)
+    parser.add_argument("--tool-budget", type=float, default=DEFAULT_TOOL_BUDGET)
+    parser.add_argument("--timeout", type=float, default=30.0)
+    parser.add_argument(
+        "--prompt",
+        choices=["prerendered", "template"],
+        default="prerendered",
+        help="Serve a freshly pre-rendered prompt artifact (as in the image) or render the template on first use.",
+    )
+    args = parser.parse_args()
+
+    listens, tools = [], []
+    with tempfile.TemporaryDirectory() as tmp:
+        rendered_prompt = None
+        if args.prompt == "prerendered":
+            rendered_prompt = Path(tmp) / "system-prompt.rendered.txt"
+            render_prompt_artifact(rendered_prompt)
+
+        for i in range(args.runs):
+            listen, tool = measure_once(args.timeout, rendered_prompt)
+            listens.append(listen)
+            tools.append(tool)
+            print(f"run {i + 1}: listen={listen:.3f}s first_tool_response={tool:.3f}s")
+
+    listen_median = statistics.median(listens)
+    tool_median = statistics.median(tools)
+    print(f"prompt={args.prompt} median: listen={listen_median:.3f}s (budget {args.listen_budget:.1f}s) "
+          f"first_tool_response={tool_median:.3f}s (budget {args.tool_budget:.1f}s)")
+
+    over_budget = listen_median > args.listen_budget or tool_median > args.tool_budget
+    if over_budget:
+        print("Startup budget exceeded", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
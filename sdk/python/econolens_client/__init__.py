@@ -1,4 +1,5 @@
 from .client import EconolensClient, TokenProvider, HistoricalDataRequest, SimulationParams, ProvidePlotRequest
+from .columnar import decode_columnar
 
 __all__ = [
     "EconolensClient",
@@ -6,4 +7,5 @@ __all__ = [
     "HistoricalDataRequest",
     "SimulationParams",
     "ProvidePlotRequest",
+    "decode_columnar",
 ]
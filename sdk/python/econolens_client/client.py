@@ -4,6 +4,8 @@ import os
 import json
 import requests
 
+from .columnar import decode_columnar
+
 TokenProvider = Callable[[], Optional[str]]
 
 HistoricalDataRequest = Dict[str, Any]
@@ -33,17 +35,32 @@ class EconolensClient:
             raise RuntimeError("Unexpected response type for fetch_context")
         return result
 
-    def get_historical_data(self, fields: Optional[Union[str, List[str]]] = None) -> Any:
+    def get_historical_data(
+        self,
+        fields: Optional[Union[str, List[str]]] = None,
+        output_format: Optional[str] = None,
+        columnar_dtype: Optional[str] = None,
+    ) -> Any:
         payload: HistoricalDataRequest = {}
         if fields is not None:
             payload["fields"] = fields
-        return self._call_tool("get_historical_data", payload)
+        if output_format is not None:
+            payload["output_format"] = output_format
+        if columnar_dtype is not None:
+            payload["columnar_dtype"] = columnar_dtype
+        result = self._call_tool("get_historical_data", {"req": payload} if payload else {})
+        if output_format == "columnar":
+            return decode_columnar(result)
+        return result
 
     def simulate(self, **params: Any) -> Any:
-        return self._call_tool("simulate", params)
+        result = self._call_tool("simulate", {"sim": params})
+        if params.get("output_format") == "columnar":
+            return decode_columnar(result)
+        return result
 
     def provide_plot(self, **params: Any) -> Any:
-        return self._call_tool("provide_plot", params)
+        return self._call_tool("provide_plot", {"req": params})
 
     def _ensure_session(self) -> None:
         if self.session_id:
@@ -134,8 +151,13 @@ class EconolensClient:
             result = data.get("result")
             if not result:
                 continue
-            # Prefer content text if present
             content = result.get("content")
+            if result.get("isError"):
+                text = ""
+                if isinstance(content, list) and content and isinstance(content[0], dict):
+                    text = content[0].get("text", "")
+                raise RuntimeError(f"Tool error: {text or 'Unknown tool error'}")
+            # Prefer content text if present
             if isinstance(content, list) and content:
                 first = content[0]
                 if isinstance(first, dict) and "text" in first:
@@ -0,0 +1,63 @@
+from __future__ import annotations
+from typing import Any, Dict, Tuple, Union
+import base64
+import json
+
+COLUMNAR_FORMAT = "columnar-v1"
+
+
+def is_columnar(payload: Any) -> bool:
+    return isinstance(payload, dict) and payload.get("format") == COLUMNAR_FORMAT
+
+
+def decode_columnar(payload: Union[str, Dict[str, Any]]) -> Dict[str, Any]:
+    """Decode a `columnar-v1` tool response into NumPy arrays.
+
+    Each column becomes a read-only array viewing its decoded buffer (no per-value
+    parsing or copying). Metadata keys are returned unchanged. `dates` maps each
+    column that has a known start date to its own read-only `datetime64[D]` axis,
+    since columns can have different anchors and lengths. Payloads in any other
+    format (e.g. error objects) are returned as parsed JSON.
+    """
+    try:
+        import numpy as np
+    except ImportError as exc:  # pragma: no cover - depends on environment
+        raise ImportError(
+            "Columnar output requires NumPy; install with `pip install econolens-client[numpy]`"
+        ) from exc
+
+    if isinstance(payload, str):
+        try:
+            data = json.loads(payload)
+        except json.JSONDecodeError as exc:
+            raise RuntimeError(f"Expected a JSON tool response, got: {payload.strip()}") from exc
+    else:
+        data = payload
+    if not is_columnar(data):
+        return data
+    if data.get("encoding") != "base64":
+        raise ValueError(f"Unsupported columnar encoding: {data.get('encoding')}")
+
+    dtype = np.dtype(data["dtype"])
+    step = np.timedelta64(int(data.get("step_days", 7)), "D")
+    result: Dict[str, Any] = dict(data.get("metadata") or {})
+    dates: Dict[str, Any] = {}
+    axes: Dict[Tuple[str, int], Any] = {}
+    for name, column in data["columns"].items():
+        values = np.frombuffer(base64.b64decode(column["data"]), dtype=dtype)
+        if len(values) != column["length"]:
+            raise ValueError(f"Column '{name}' length mismatch: {len(values)} != {column['length']}")
+        result[name] = values
+
+        start = column.get("start")
+        if start:
+            key = (start, len(values))
+            if key not in axes:
+                axis = np.datetime64(start, "D") + np.arange(len(values)) * step
+                # Shared between columns with the same anchor, so keep it read-only like the values.
+                axis.setflags(write=False)
+                axes[key] = axis
+            dates[name] = axes[key]
+
+    result["dates"] = dates
+    return result
@@ -0,0 +1,47 @@
+import base64
+import json
+import struct
+import sys
+from pathlib import Path
+import pytest
+
+# Ensure local package is importable without installing in this interpreter
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+np = pytest.importorskip("numpy")
+pytest.importorskip("requests")
+
+from econolens_client import decode_columnar
+
+
+def test_decode_columnar_handbuilt_payload():
+    values = [1.5, 2.25, float("nan")]
+    payload = {
+        "format": "columnar-v1",
+        "encoding": "base64",
+        "dtype": "<f8",
+        "step_days": 7,
+        "columns": {
+            "available_supply": {
+                "data": base64.b64encode(struct.pack("<3d", *values)).decode("ascii"),
+                "length": 3,
+                "start": "2025-01-06",
+            },
+        },
+        "metadata": {"n_entries": 3},
+    }
+
+    decoded = decode_columnar(json.dumps(payload))
+
+    assert decoded["available_supply"][:2].tolist() == [1.5, 2.25]
+    assert np.isnan(decoded["available_supply"][2])
+    assert decoded["n_entries"] == 3
+    assert decoded["dates"]["available_supply"][-1] == np.datetime64("2025-01-20")
+
+
+def test_decode_columnar_passthrough_and_errors():
+    error = {"error": "Connection failed"}
+    assert decode_columnar(json.dumps(error)) == error
+
+    with pytest.raises(RuntimeError, match="1 validation error"):
+        decode_columnar("1 validation error for call[simulate]")
@@ -1,19 +1,30 @@
 """MCP server for mechafil-server API endpoints."""
 
+import base64
 import json
 import os
 import re
+import sys
+import threading
+from array import array
 from pathlib import Path
-from typing import Dict, List, Optional, Union, Any, Annotated
+from typing import Dict, List, Optional, Union, Any, Annotated, Callable, Literal
 from pydantic import BaseModel, Field
-import requests
 from fastmcp import FastMCP
-from fastmcp.tools.tool import ToolResult
+
+# `requests` is imported inside the tools that use it: it is not needed to start
+# listening, and on scale-to-zero machines import time is paid by the first user.
 
 # Server configuration
 MECHAFIL_SERVER_URL = os.getenv("MECHAFIL_SERVER_URL", "https://mechafil-api.fly.dev")
 SYSTEM_PROMPT_PATH = Path(__file__).with_name("system-prompt.txt")
 SYSTEM_PROMPT_INCLUDE_PATTERN = re.compile(r"\{\{\s*include:(?P<path>[^}]+)\}\}")
+# Optional pre-rendered prompt produced at image build time (see Dockerfile).
+# Only honoured (and cached) when set; otherwise the template is rendered on every
+# fetch_context call so local edits take effect without a restart.
+SYSTEM_PROMPT_RENDERED_PATH = os.getenv("SYSTEM_PROMPT_RENDERED_PATH")
+
+_system_prompt_cache: Optional[str] = None
 
 
 def _render_system_prompt(template_path: Path) -> str:
@@ -72,6 +83,38 @@ def _render_system_prompt(template_path: Path) -> str:
     return rendered
 
 
+def _load_system_prompt() -> str:
+    """Return the rendered system prompt, preferring (and caching) the build-time artifact."""
+    global _system_prompt_cache
+    if _system_prompt_cache is not None:
+        return _system_prompt_cache
+
+    if SYSTEM_PROMPT_RENDERED_PATH:
+        rendered_path = Path(SYSTEM_PROMPT_RENDERED_PATH)
+        if not rendered_path.is_absolute():
+            rendered_path = SYSTEM_PROMPT_PATH.parent / rendered_path
+        try:
+            _system_prompt_cache = rendered_path.read_text(encoding="utf-8")
+            return _system_prompt_cache
+        except FileNotFoundError:
+            # Fall back to rendering the template at request time.
+            pass
+
+    return _render_system_prompt(SYSTEM_PROMPT_PATH)
+
+
+def _wake_mechafil_api() -> None:
+    """Ping the mechafil API health endpoint so it starts booting; errors are ignored."""
+    try:
+        import requests
+
+        health_url = f"{MECHAFIL_SERVER_URL.rstrip('/')}/health"
+        requests.get(health_url, timeout=5)
+    except Exception:
+        # Intentionally swallow errors; this is only a warm-up request.
+        pass
+
+
 # Create MCP server
 mcp = FastMCP("mechafil-server")
 
@@ -83,15 +126,11 @@ def fetch_context() -> str:
     Call once at startup (per session) before any other tool.
     """
     # Wake the mechafil API so downstream calls don't pay the cold-start penalty.
-    try:
-        health_url = f"{MECHAFIL_SERVER_URL.rstrip('/')}/health"
-        requests.get(health_url, timeout=5)
-    except Exception:
-        # Intentionally swallow errors; the caller only needs the prompt text.
-        pass
+    # Done in the background: the caller only needs the prompt text.
+    threading.Thread(target=_wake_mechafil_api, daemon=True).start()
 
     try:
-        return _render_system_prompt(SYSTEM_PROMPT_PATH)
+        return _load_system_prompt()
     except FileNotFoundError as exc:
         raise FileNotFoundError(str(exc)) from exc
     except Exception as exc:
@@ -109,6 +148,101 @@ CUMULATIVE_TO_DAILY: Dict[str, str] = {
     "network_gas_burn":    "daily_gas_burn",
 }
 
+# Opt-in binary output for programmatic (SDK) consumers pulling many series.
+# Numeric arrays are packed as base64 little-endian float buffers instead of
+# decimal JSON text; everything else is passed through under `metadata`.
+COLUMNAR_FORMAT = "columnar-v1"
+COLUMNAR_DTYPES: Dict[str, tuple] = {
+    # dtype name -> (array typecode, NumPy-style dtype string)
+    "float64": ("d", "<f8"),
+    "float32": ("f", "<f4"),
+}
+
+# Largest finite float32; bigger magnitudes would silently pack as inf.
+FLOAT32_MAX = 3.4028234663852886e38
+
+OutputFormat = Literal["json", "columnar"]
+ColumnarDtype = Literal["float64", "float32"]
+
+
+def _is_numeric_series(values: Any) -> bool:
+    return isinstance(values, list) and all(
+        v is None or (isinstance(v, (int, float)) and not isinstance(v, bool)) for v in values
+    )
+
+
+# Date anchors for historical arrays (see mcp-tools-context.txt). Anything not
+# listed starts at `data_start_date`.
+HISTORICAL_WINDOW_FIELDS = {
+    "raw_byte_power",
+    "raw_byte_power_onboarded_pib_per_day",
+    "raw_byte_power_onboarded_eib_per_day",
+    "renewal_rate",
+    "filplus_rate",
+}
+HISTORICAL_FORECAST_FIELDS = {
+    "rb_known_scheduled_expire_vec",
+    "qa_known_scheduled_expire_vec",
+}
+
+
+def _historical_column_start(record: Dict[str, Any], field: str) -> Optional[str]:
+    """Return the ISO date of index 0 for a historical array, or None if unknown."""
+    if field in HISTORICAL_WINDOW_FIELDS:
+        return record.get("hist_window_start_date")
+    if field in HISTORICAL_FORECAST_FIELDS:
+        # Forecast-only vectors start at `current_date`; leave them undated if absent.
+        return record.get("current_date")
+    return record.get("data_start_date")
+
+
+def _encode_columnar(
+    record: Dict[str, Any],
+    dtype: str = "float64",
+    column_start: Optional[Callable[[str], Optional[str]]] = None,
+) -> Dict[str, Any]:
+    """Pack the numeric list values of `record` into base64 float buffers.
+
+    Missing values (None) are encoded as NaN. Each column carries its own
+    `length` and, when `column_start` returns an ISO date for it, the `start`
+    date of index 0; dates then advance by `step_days` per entry. A float32
+    request falls back to float64 if any value is outside the float32 range.
+    """
+    if dtype == "float32" and any(
+        v is not None and FLOAT32_MAX < abs(v) < float("inf")
+        for values in record.values() if _is_numeric_series(values)
+        for v in values
+    ):
+        dtype = "float64"
+    typecode, dtype_str = COLUMNAR_DTYPES[dtype]
+    columns: Dict[str, Dict[str, Any]] = {}
+    metadata: Dict[str, Any] = {}
+
+    for key, values in record.items():
+        if not _is_numeric_series(values) or not values:
+            metadata[key] = values
+            continue
+        buffer = array(typecode, (float("nan") if v is None else v for v in values))
+        if sys.byteorder == "big":
+            buffer.byteswap()
+        column: Dict[str, Any] = {
+            "data": base64.b64encode(buffer.tobytes()).decode("ascii"),
+            "length": len(buffer),
+        }
+        start = column_start(key) if column_start else None
+        if start:
+            column["start"] = start
+        columns[key] = column
+
+    return {
+        "format": COLUMNAR_FORMAT,
+        "encoding": "base64",
+        "dtype": dtype_str,
+        "step_days": record.get("timestep_days", 7),
+        "columns": columns,
+        "metadata": metadata,
+    }
+
 
 class SimulationInputs(BaseModel):
     """Parameters for Filecoin economic simulation. All fields are optional with intelligent defaults."""
@@ -166,6 +300,21 @@ class SimulationInputs(BaseModel):
         )
     ] = None
 
+    output_format: Annotated[
+        Optional[OutputFormat],
+        Field(
+            description=(
+                "Response encoding for programmatic SDK clients only; leave unset in chat. "
+                "'columnar' returns metric arrays as base64-packed float buffers with a date axis."
+            )
+        )
+    ] = None
+
+    columnar_dtype: Annotated[
+        Optional[ColumnarDtype],
+        Field(description="Float width for 'columnar' output (default float64).")
+    ] = None
+
 
 class HistoricalDataRequest(BaseModel):
     """Optional filters for historical data tool."""
@@ -181,6 +330,22 @@ class HistoricalDataRequest(BaseModel):
         )
     ] = None
 
+    output_format: Annotated[
+        Optional[OutputFormat],
+        Field(
+            default=None,
+            description=(
+                "Response encoding for programmatic SDK clients only; leave unset in chat. "
+                "'columnar' returns arrays as base64-packed float buffers with a date axis."
+            )
+        )
+    ] = None
+
+    columnar_dtype: Annotated[
+        Optional[ColumnarDtype],
+        Field(default=None, description="Float width for 'columnar' output (default float64).")
+    ] = None
+
 
 class PlotSeries(BaseModel):
     """Single series configuration for chart output."""
@@ -234,6 +399,8 @@ def simulate(sim: SimulationInputs) -> dict:
     - Output is Monday-sampled. The response includes an `Explanation` reflecting
       the actual inputs used after defaults are applied.
     """
+    import requests
+
     # Build request payload, excluding None values
     payload = {}
     if sim.rbp is not None:
@@ -323,6 +490,10 @@ def simulate(sim: SimulationInputs) -> dict:
     result["sim_end_date"] = sim_end
     result["timestep_days"] = timestep
     result["n_entries"] = actual_n
+    if sim.output_format == "columnar":
+        # Every column starts at sim_start_date. The daily_* columns have one entry
+        # fewer: value t is the daily average over the week starting at date t.
+        return _encode_columnar(result, sim.columnar_dtype or "float64", lambda _: sim_start)
     return result
     
 
@@ -334,6 +505,8 @@ def get_historical_data(req: Optional[HistoricalDataRequest] = None) -> str:
     - The response includes explicit date metadata to anchor arrays.
     - For plot requests, always use `fields` to return only the requested series.
     """
+    import requests
+
     try:
         response = requests.get(
             f"{MECHAFIL_SERVER_URL}/historical-data",
@@ -354,12 +527,21 @@ def get_historical_data(req: Optional[HistoricalDataRequest] = None) -> str:
                 "timestep_days",
                 "n_entries",
                 "hist_window_n_entries",
+                "current_date",
                 "field_meta",
             }
             if isinstance(data, dict) and isinstance(data.get("data"), dict):
                 filtered = {k: v for k, v in data["data"].items() if k in metadata_keys or k in fields}
                 data = {"data": filtered}
 
+        if req and req.output_format == "columnar" and isinstance(data, dict) and isinstance(data.get("data"), dict):
+            record = data["data"]
+            data = _encode_columnar(
+                record,
+                req.columnar_dtype or "float64",
+                lambda field: _historical_column_start(record, field),
+            )
+
         return json.dumps(data)
     
     except requests.exceptions.ConnectionError:
@@ -425,7 +607,22 @@ def provide_plot(req: ProvidePlotRequest) -> dict:
 
 
 if __name__ == "__main__":
-    import os
+    import argparse
+
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--render-system-prompt",
+        metavar="PATH",
+        help="Write the fully rendered system prompt to PATH and exit (used at image build time).",
+    )
+    args = parser.parse_args()
+
+    if args.render_system_prompt:
+        Path(args.render_system_prompt).write_text(
+            _render_system_prompt(SYSTEM_PROMPT_PATH), encoding="utf-8"
+        )
+        sys.exit(0)
+
     transport = os.getenv("MCP_TRANSPORT", "stdio")
 
     if transport == "http":
@@ -0,0 +1,172 @@
+"""Columnar output: encode with the server, decode with the client."""
+import socket
+import sys
+import threading
+import time
+from pathlib import Path
+from unittest import mock
+import pytest
+
+# Make server.py and the in-repo Python SDK importable without installing them
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.append(str(ROOT))
+sys.path.append(str(ROOT / "sdk" / "python"))
+
+np = pytest.importorskip("numpy")
+pytest.importorskip("fastmcp")
+uvicorn = pytest.importorskip("uvicorn")
+
+import server
+from econolens_client import EconolensClient, decode_columnar
+
+HISTORICAL_RESPONSE = {
+    "data": {
+        "data_start_date": "2022-10-10",
+        "hist_window_start_date": "2025-04-07",
+        "current_date": "2025-10-08",
+        "timestep_days": 7,
+        "n_entries": 4,
+        "hist_window_n_entries": 2,
+        "field_meta": {"raw_byte_power": {"unit": "PiB/day"}},
+        "raw_byte_power": [3.5, None],
+        "network_RBP_EIB": [10.0, 11.0, 12.0, 13.0],
+        "rb_known_scheduled_expire_vec": [0.5, 0.25, 0.125],
+        "raw_byte_power_averaged_over_previous_30days": 3.2,
+    }
+}
+
+SIMULATE_RESPONSE = {
+    "simulation_output": {
+        "available_supply": [100.0, 101.0, 102.0],
+        "cum_simple_reward": [0.0, 7.0, 21.0],
+    },
+    "input": {
+        "raw_byte_power": 3.5,
+        "renewal_rate": 0.8,
+        "filplus_rate": 0.9,
+        "sim_start_date": "2025-01-06",
+        "timestep_days": 7,
+    },
+}
+
+
+def _fake_response(payload):
+    response = mock.Mock()
+    response.json.return_value = payload
+    response.raise_for_status.return_value = None
+    return response
+
+
+def test_encode_decode_roundtrip_nan_metadata_and_lengths():
+    record = HISTORICAL_RESPONSE["data"]
+    encoded = server._encode_columnar(
+        record, "float64", lambda field: server._historical_column_start(record, field)
+    )
+    decoded = decode_columnar(encoded)
+
+    assert decoded["raw_byte_power"].dtype == np.float64
+    assert decoded["raw_byte_power"][0] == 3.5 and np.isnan(decoded["raw_byte_power"][1])
+    assert decoded["network_RBP_EIB"].tolist() == [10.0, 11.0, 12.0, 13.0]
+    # Scalars, dicts and dates pass through untouched
+    assert decoded["raw_byte_power_averaged_over_previous_30days"] == 3.2
+    assert decoded["field_meta"] == record["field_meta"]
+    assert decoded["hist_window_start_date"] == "2025-04-07"
+
+    dates = decoded["dates"]
+    assert [str(d) for d in dates["raw_byte_power"]] == ["2025-04-07", "2025-04-14"]
+    assert len(dates["network_RBP_EIB"]) == 4
+    assert str(dates["network_RBP_EIB"][0]) == "2022-10-10"
+    assert str(dates["rb_known_scheduled_expire_vec"][0]) == "2025-10-08"
+    assert len(dates["rb_known_scheduled_expire_vec"]) == 3
+
+
+def test_encode_float32_and_undated_forecast_vectors():
+    record = {k: v for k, v in HISTORICAL_RESPONSE["data"].items() if k != "current_date"}
+    decoded = decode_columnar(server._encode_columnar(
+        record, "float32", lambda field: server._historical_column_start(record, field)
+    ))
+
+    assert decoded["network_RBP_EIB"].dtype == np.float32
+    assert decoded["rb_known_scheduled_expire_vec"].tolist() == [0.5, 0.25, 0.125]
+    # No current_date in the payload, so forecast-only vectors are not dated
+    assert "rb_known_scheduled_expire_vec" not in decoded["dates"]
+
+
+def test_encode_float32_falls_back_to_float64_on_overflow():
+    record = {"circ_supply": [1e40, 2.0, None], "timestep_days": 7}
+    encoded = server._encode_columnar(record, "float32")
+    assert encoded["dtype"] == "<f8"
+
+    decoded = decode_columnar(encoded)
+    assert decoded["circ_supply"][0] == 1e40 and np.isfinite(decoded["circ_supply"][0])
+
+
+def test_decoded_date_axes_are_read_only():
+    record = {"a": [1.0, 2.0], "b": [3.0, 4.0], "timestep_days": 7}
+    decoded = decode_columnar(server._encode_columnar(record, "float64", lambda _: "2025-01-06"))
+
+    with pytest.raises(ValueError):
+        decoded["dates"]["a"][0] = np.datetime64("2000-01-01")
+    assert str(decoded["dates"]["b"][0]) == "2025-01-06"
+
+
+@pytest.fixture(scope="module")
+def base_url():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+    config = uvicorn.Config(server.mcp.http_app(), host="127.0.0.1", port=port, log_level="warning")
+    http_server = uvicorn.Server(config)
+    thread = threading.Thread(target=http_server.run, daemon=True)
+    thread.start()
+    deadline = time.time() + 10
+    while not http_server.started and time.time() < deadline:
+        time.sleep(0.05)
+    yield f"http://127.0.0.1:{port}/mcp"
+    http_server.should_exit = True
+    thread.join(timeout=5)
+
+
+def test_client_historical_columnar(base_url):
+    client = EconolensClient(base_url=base_url)
+    with mock.patch("requests.get", return_value=_fake_response(HISTORICAL_RESPONSE)):
+        hist = client.get_historical_data(fields=["raw_byte_power"], output_format="columnar")
+
+    assert set(hist["dates"]) == {"raw_byte_power"}
+    assert str(hist["dates"]["raw_byte_power"][0]) == "2025-04-07"
+    assert "network_RBP_EIB" not in hist
+
+
+def test_client_historical_columnar_forecast_vector_keeps_dates(base_url):
+    client = EconolensClient(base_url=base_url)
+    with mock.patch("requests.get", return_value=_fake_response(HISTORICAL_RESPONSE)):
+        hist = client.get_historical_data(
+            fields=["rb_known_scheduled_expire_vec"], output_format="columnar"
+        )
+
+    assert hist["rb_known_scheduled_expire_vec"].tolist() == [0.5, 0.25, 0.125]
+    assert [str(d) for d in hist["dates"]["rb_known_scheduled_expire_vec"]] == [
+        "2025-10-08", "2025-10-15", "2025-10-22",
+    ]
+
+
+def test_client_simulate_columnar_daily_alignment(base_url):
+    client = EconolensClient(base_url=base_url)
+    with mock.patch("requests.post", return_value=_fake_response(SIMULATE_RESPONSE)):
+        sim = client.simulate(
+            requested_metrics=["available_supply", "cum_simple_reward"],
+            output_format="columnar",
+        )
+
+    assert sim["available_supply"].tolist() == [100.0, 101.0, 102.0]
+    # Differenced columns have one entry fewer; value t covers the week starting at date t
+    assert sim["daily_simple_reward"].tolist() == [1.0, 2.0]
+    assert [str(d) for d in sim["dates"]["daily_simple_reward"]] == ["2025-01-06", "2025-01-13"]
+    assert len(sim["dates"]["available_supply"]) == 3
+    assert sim["n_entries"] == 3
+
+
+def test_client_surfaces_tool_errors(base_url):
+    client = EconolensClient(base_url=base_url)
+    with pytest.raises(RuntimeError, match="Tool error"):
+        client.simulate(output_format="parquet")